@@ -131,10 +131,25 @@ def compose_url(scheme, host, port, path="/"):
 
 
 def greatest_common_superclass(instances):
-    classes = [type(x).mro() for x in instances]
-    for x in classes[0]:
-        if all(x in mro for mro in classes):
-            return x
+    return greatest_common_superclass_by_types(
+        frozenset(type(x) for x in instances)
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def greatest_common_superclass_by_types(types):
+    """Return the greatest common superclass of the given classes.
+
+    Results are cached, `types` must be hashable (e.g. a frozenset).
+    """
+    first, *others = types
+    common = set(first.__mro__)
+    for cls in others:
+        common.intersection_update(cls.__mro__)
+
+    for cls in first.__mro__:
+        if cls in common:
+            return cls
 
 
 def typename(obj):
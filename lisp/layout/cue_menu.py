@@ -125,6 +125,11 @@ def create_qmenu(actions, cues, menu):
 
 
 class CueContextMenu(ClassBasedRegistry):
+    def __init__(self):
+        super().__init__()
+        # Cache the filtered items, the registry rarely changes
+        self._filter_cache = {}
+
     def add(self, item, ref_class=Cue):
         """
         :type item: typing.Union[MenuAction, MenuActionGroup]
@@ -138,13 +143,31 @@ class CueContextMenu(ClassBasedRegistry):
             )
 
         super().add(item, ref_class)
+        self.__registry_changed()
+
+    def remove(self, item):
+        super().remove(item)
+        self.__registry_changed()
 
     def filter(self, ref_class=Cue):
-        return super().filter(ref_class)
+        items = self._filter_cache.get(ref_class)
+        if items is None:
+            items = tuple(super().filter(ref_class))
+            self._filter_cache[ref_class] = items
+
+        return items
 
     def clear_class(self, ref_class=Cue):
-        return super().filter(ref_class)
+        super().clear_class(ref_class)
+        self.__registry_changed()
+
+    def clear(self):
+        super().clear()
+        self.__registry_changed()
 
     def create_qmenu(self, cues, parent):
         ref_class = greatest_common_superclass(cues)
         return create_qmenu(self.filter(ref_class), cues, QMenu(parent))
+
+    def __registry_changed(self):
+        self._filter_cache.clear()
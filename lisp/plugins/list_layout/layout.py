@@ -15,7 +15,13 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
-from PyQt5.QtCore import Qt, QT_TRANSLATE_NOOP, QTimer
+from PyQt5.QtCore import (
+    Qt,
+    QT_TRANSLATE_NOOP,
+    QTimer,
+    QItemSelection,
+    QItemSelectionModel,
+)
 from PyQt5.QtGui import QKeySequence
 from PyQt5.QtWidgets import QAction
 
@@ -34,7 +40,7 @@ from lisp.plugins.list_layout.list_view import CueListView
 from lisp.plugins.list_layout.models import CueListModel, RunningCueModel
 from lisp.plugins.list_layout.view import ListLayoutView
 from lisp.ui.ui_utils import translate
-from lisp.ui.widgets.hotkeyedit import keyEventKeySequence
+from lisp.ui.widgets.hotkeyedit import keyEventKeys
 
 
 class ListLayout(CueLayout):
@@ -66,9 +72,15 @@ class ListLayout(CueLayout):
         super().__init__(application)
         self._list_model = CueListModel(self.cue_model)
         self._list_model.item_added.connect(self.__cue_added)
+        self._list_model.item_removed.connect(self.__cue_removed)
         self._running_model = RunningCueModel(self.cue_model)
         self._go_timer = QTimer()
         self._go_timer.setSingleShot(True)
+        # Collapse consecutive standby changes (e.g. from cue.next bursts)
+        self._pending_standby = None
+        self._standby_timer = QTimer()
+        self._standby_timer.setSingleShot(True)
+        self._standby_timer.timeout.connect(self.__flush_standby_index)
 
         self._view = ListLayoutView(
             self._list_model, self._running_model, self.Config
@@ -157,6 +169,17 @@ class ListLayout(CueLayout):
             ListLayout.Config["goKeyDisabledWhilePlaying"]
         )
 
+        # GO and Delete keys, cached to avoid building key-sequences on
+        # each key-press
+        self.__update_go_keys()
+        self._delete_keys = frozenset(
+            sequence[0]
+            for sequence in QKeySequence.keyBindings(QKeySequence.Delete)
+            if sequence.count()
+        )
+        ListLayout.Config.changed.connect(self.__config_changed)
+        ListLayout.Config.updated.connect(self.__config_updated)
+
         # Context menu actions
         self._edit_actions_group = MenuActionsGroup(priority=MENU_PRIORITY_CUE)
         self._edit_actions_group.add(
@@ -220,12 +243,20 @@ class ListLayout(CueLayout):
         return self._view
 
     def cues(self, cue_type=Cue):
-        yield from self._list_model
+        if cue_type is Cue:
+            return list(self._list_model)
+
+        return (cue for cue in self._list_model if isinstance(cue, cue_type))
 
     def standby_index(self):
+        if self._pending_standby is not None:
+            return self._pending_standby
+
         return self._view.listView.standbyIndex()
 
     def set_standby_index(self, index):
+        self._pending_standby = None
+        self._standby_timer.stop()
         self._view.listView.setStandbyIndex(index)
 
     def go(self, action=CueAction.Default, advance=1):
@@ -241,10 +272,12 @@ class ListLayout(CueLayout):
         return self._list_model.item(index)
 
     def selected_cues(self, cue_type=Cue):
-        for item in self._view.listView.selectedItems():
-            yield self._list_model.item(
-                self._view.listView.indexOfTopLevelItem(item)
-            )
+        item = self._list_model.item
+        rows = self._view.listView.selectionModel().selectedRows()
+        for row in sorted(index.row() for index in rows):
+            cue = item(row)
+            if isinstance(cue, cue_type):
+                yield cue
 
     def finalize(self):
         # Clean layout menu
@@ -253,39 +286,89 @@ class ListLayout(CueLayout):
         self.CuesMenu.remove(self._edit_actions_group)
         # Remove reference cycle
         del self._edit_actions_group
+        # Stop following the configuration
+        ListLayout.Config.changed.disconnect(self.__config_changed)
+        ListLayout.Config.updated.disconnect(self.__config_updated)
+        # Drop any pending standby change
+        self._standby_timer.stop()
+        self._pending_standby = None
 
     def select_all(self, cue_type=Cue):
         if self.selection_mode:
-            for index in range(self._view.listView.topLevelItemCount()):
-                if isinstance(self._list_model.item(index), cue_type):
-                    self._view.listView.topLevelItem(index).setSelected(True)
+            if cue_type is Cue:
+                self._view.listView.selectAll()
+            else:
+                self.__select_rows(
+                    self.__rows_of_type(cue_type), QItemSelectionModel.Select
+                )
 
     def deselect_all(self, cue_type=Cue):
-        for index in range(self._view.listView.topLevelItemCount()):
-            if isinstance(self._list_model.item(index), cue_type):
-                self._view.listView.topLevelItem(index).setSelected(False)
+        if cue_type is Cue:
+            self._view.listView.clearSelection()
+        else:
+            self.__select_rows(
+                self.__rows_of_type(cue_type), QItemSelectionModel.Deselect
+            )
 
     def invert_selection(self):
-        if self.selection_mode:
-            for index in range(self._view.listView.topLevelItemCount()):
-                item = self._view.listView.topLevelItem(index)
-                item.setSelected(not item.isSelected())
+        if self.selection_mode and len(self._list_model):
+            # Toggle all the rows at once, the selection-model keeps the state
+            list_view = self._view.listView
+            model = list_view.model()
+            list_view.selectionModel().select(
+                QItemSelection(
+                    model.index(0, 0),
+                    model.index(len(self._list_model) - 1, 0),
+                ),
+                QItemSelectionModel.Toggle | QItemSelectionModel.Rows,
+            )
+
+    def __rows_of_type(self, cue_type):
+        return (
+            index
+            for index, cue in enumerate(self._list_model)
+            if isinstance(cue, cue_type)
+        )
+
+    def __select_rows(self, rows, command):
+        """Apply `command` to the given (ascending) rows with a single call.
+
+        A single `select` call makes the selection-model emit only one
+        `selectionChanged` signal, contiguous rows are merged in a single
+        range to keep the selection small.
+        """
+        list_view = self._view.listView
+        model_index = list_view.model().index
+        selection = QItemSelection()
+
+        first = last = None
+        for row in rows:
+            if last is not None and row == last + 1:
+                last = row
+                continue
+
+            if first is not None:
+                selection.select(model_index(first, 0), model_index(last, 0))
+            first = last = row
+
+        if first is not None:
+            selection.select(model_index(first, 0), model_index(last, 0))
+            list_view.selectionModel().select(
+                selection, command | QItemSelectionModel.Rows
+            )
 
     def _key_pressed(self, event):
         event.ignore()
         if not event.isAutoRepeat():
-            sequence = keyEventKeySequence(event)
-            goSequence = QKeySequence(
-                ListLayout.Config["goKey"], QKeySequence.NativeText
-            )
-            if sequence in goSequence:
+            keys = keyEventKeys(event)
+            if keys in self._go_keys:
                 event.accept()
                 if not (
                     self.go_key_disabled_while_playing
                     and len(self._running_model)
                 ):
                     self.__go_slot()
-            elif sequence == QKeySequence.Delete:
+            elif keys in self._delete_keys:
                 event.accept()
                 self._remove_cues(self.selected_cues())
             elif (
@@ -362,7 +445,9 @@ class ListLayout(CueLayout):
             if standby >= 0:
                 self._view.listView.topLevelItem(standby).setSelected(True)
         else:
-            self.deselect_all()
+            # Changing the selection-mode doesn't clear the current selection
+            if self._view.listView.selectionModel().hasSelection():
+                self.deselect_all()
             self._view.listView.setSelectionMode(CueListView.NoSelection)
 
     @selection_mode.get
@@ -423,24 +508,60 @@ class ListLayout(CueLayout):
             self._go_timer.setInterval(ListLayout.Config.get("goDelay"))
             self._go_timer.start()
 
+    def __update_go_keys(self):
+        sequence = QKeySequence(
+            ListLayout.Config["goKey"], QKeySequence.NativeText
+        )
+        self._go_keys = frozenset(
+            sequence[index] for index in range(sequence.count())
+        )
+
+    def __config_changed(self, key, _):
+        if key == "goKey":
+            self.__update_go_keys()
+
+    def __config_updated(self, diff):
+        if "goKey" in diff:
+            self.__update_go_keys()
+
     def __cue_added(self, cue):
         cue.next.connect(self.__cue_next, Connection.QtQueued)
 
+    def __cue_removed(self, cue):
+        # Removed cues can be re-added (e.g. undo), which reconnects them
+        cue.next.disconnect(self.__cue_next)
+
     def __cue_next(self, cue):
         try:
+            model = self._list_model
             next_index = cue.index + 1
-            if next_index < len(self._list_model):
-                action = CueNextAction(cue.next_action)
-                if (
-                    action == CueNextAction.SelectAfterEnd
-                    or action == CueNextAction.SelectAfterWait
-                ):
-                    self.set_standby_index(next_index)
-                else:
-                    next_cue = self._list_model.item(next_index)
-                    next_cue.execute()
+            if next_index >= len(model):
+                return
 
-                    if self.auto_continue and next_cue is self.standby_cue():
-                        self.set_standby_index(next_index + 1)
+            action = CueNextAction(cue.next_action)
+            if (
+                action == CueNextAction.SelectAfterEnd
+                or action == CueNextAction.SelectAfterWait
+            ):
+                self.__queue_standby_index(next_index)
+            elif action != CueNextAction.DoNothing:
+                model.item(next_index).execute()
+
+                # Compare indices, no need to fetch the standby cue
+                if self.auto_continue and next_index == self.standby_index():
+                    self.__queue_standby_index(next_index + 1)
         except (IndexError, KeyError):
             pass
+
+    def __queue_standby_index(self, index):
+        # Only the last requested index is applied, once control returns
+        # to the event-loop, avoiding a view update for each request.
+        # Until then `standby_index()`, and so `standby_cue()`, intentionally
+        # report the pending index, even if it's not highlighted yet.
+        if 0 <= index < len(self._list_model):
+            self._pending_standby = index
+            self._standby_timer.start(0)
+
+    def __flush_standby_index(self):
+        if self._pending_standby is not None:
+            self.set_standby_index(self._pending_standby)
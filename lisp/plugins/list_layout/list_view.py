@@ -17,6 +17,7 @@
 
 from PyQt5.QtCore import (
     pyqtSignal,
+    pyqtSlot,
     Qt,
     QDataStream,
     QIODevice,
@@ -213,7 +214,16 @@ class CueListView(QTreeWidget):
         self.updateHeadersSizes()
 
     def standbyIndex(self):
-        return self.indexOfTopLevelItem(self.currentItem())
+        # Using the cue index avoids the linear search of
+        # `indexOfTopLevelItem`. It matches the item row only outside the
+        # model signals dispatch: the model updates the indices before the
+        # view items are inserted/moved/taken, and removed cues keep their
+        # old index, so this should not be used from model slots.
+        item = self.currentItem()
+        if item is not None:
+            return item.cue.index
+
+        return -1
 
     def setStandbyIndex(self, newIndex):
         if 0 <= newIndex < self.topLevelItemCount():
@@ -239,6 +249,7 @@ class CueListView(QTreeWidget):
                 header.setSectionResizeMode(i, QHeaderView.Fixed)
                 header.resizeSection(i, max(contentWidth, stretchWidth))
 
+    @pyqtSlot(QTreeWidgetItem, QTreeWidgetItem)
     def __currentItemChanged(self, current, previous):
         if previous is not None:
             previous.current = False
@@ -322,6 +333,7 @@ class CueListView(QTreeWidget):
 
         self.updateGeometries()
 
+    @pyqtSlot(int, int)
     def __updateScrollRange(self, min_, max_):
         if not self.__scrollRangeGuard:
             self.__scrollRangeGuard = True
@@ -84,8 +84,7 @@ class CueListModel(ModelAdapter):
             self.__cues[index].index = index
 
     def __iter__(self):
-        for cue in self.__cues:
-            yield cue
+        return iter(self.__cues)
 
 
 class RunningCueModel(ReadOnlyProxyModel):
@@ -15,8 +15,14 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QWidget, QSizePolicy, QSplitter, QVBoxLayout
+from PyQt5.QtCore import Qt, pyqtSlot
+from PyQt5.QtWidgets import (
+    QWidget,
+    QSizePolicy,
+    QSplitter,
+    QVBoxLayout,
+    QTreeWidgetItem,
+)
 
 from lisp.plugins.list_layout.list_view import CueListView
 from lisp.plugins.list_layout.playing_view import RunningCuesListWidget
@@ -129,6 +135,7 @@ class ListLayoutView(QWidget):
         for n in range(splitter.count()):
             splitter.handle(n).setEnabled(enabled)
 
+    @pyqtSlot(QTreeWidgetItem, QTreeWidgetItem)
     def __listViewCurrentChanged(self, current, _):
         cue = None
         if current is not None:
@@ -41,20 +41,26 @@ KEYS_FILTER = {
 }
 
 
-def keyEventKeySequence(keyEvent) -> QKeySequence:
+def keyEventKeys(keyEvent) -> int:
+    """Return the event key combined with its modifiers, or 0 if filtered."""
     key = keyEvent.key()
     if key not in KEYS_FILTER:
         modifiers = keyEvent.modifiers()
-        if modifiers & Qt.ShiftModifier:
-            key += Qt.SHIFT
-        if modifiers & Qt.ControlModifier:
-            key += Qt.CTRL
-        if modifiers & Qt.AltModifier:
-            key += Qt.ALT
-        if modifiers & Qt.MetaModifier:
-            key += Qt.META
-
-        return QKeySequence(key)
+        return (
+            key
+            | (Qt.SHIFT if modifiers & Qt.ShiftModifier else 0)
+            | (Qt.CTRL if modifiers & Qt.ControlModifier else 0)
+            | (Qt.ALT if modifiers & Qt.AltModifier else 0)
+            | (Qt.META if modifiers & Qt.MetaModifier else 0)
+        )
+
+    return 0
+
+
+def keyEventKeySequence(keyEvent) -> QKeySequence:
+    keys = keyEventKeys(keyEvent)
+    if keys:
+        return QKeySequence(keys)
 
     return QKeySequence()
 